@@ -13,17 +13,21 @@ In the future, I would like to add:
 - Player projections based on previous seasons and current season statistics, using machine learning
 """
 # Import necessary libraries
+import argparse
 import datetime
+import http.cookiejar
+import io
 import json
-import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import gspread
 import numpy as np
 import pandas as pd
-from matplotlib import pyplot as plt
-from scipy.stats import zscore
+import requests
+from numba import njit, prange
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.options import Options
@@ -52,20 +56,76 @@ URL_ALL_STRENGTHS, URL_EVEN_STRENGTH = (
     "https://www.naturalstattrick.com/playerteams.php?fromseason=20232024&thruseason=20232024&stype=2&sit=all&score=all&stdoi=std&rate=n&team=ALL&pos=S&loc=B&toi=0&gpfilt=none&fd=&td=&tgp=410&lines=single&draftteam=ALL",
     "https://www.naturalstattrick.com/playerteams.php?fromseason=20232024&thruseason=20232024&stype=2&sit=ev&score=all&stdoi=std&rate=n&team=ALL&pos=S&loc=B&toi=0&gpfilt=none&fd=&td=&tgp=410&lines=single&draftteam=ALL",
 )
+# NST columns the script uses and their dtypes, everything else in the scrape is dropped
+NST_DTYPES = {
+    "Player": str,
+    "Team": str,
+    "Position": str,
+    "GP": "float32",
+    "TOI": "float64",  # fractional minutes, kept at full precision so the sheet doesn't show float32 noise
+    "Goals": "float32",
+    "Total Assists": "float32",
+    "Total Points": "float32",
+    "Shots": "float32",
+    "Hits": "float32",
+    "Shots Blocked": "float32",
+    "Takeaways": "float32",
+    "Faceoffs Won": "float32",
+}
+NST_COLUMNS = list(NST_DTYPES)
+FANTRAX_DTYPES = {"Player": str, "Team": str, "Position": str}
 URL_FBL_FANTRAX = "https://www.fantrax.com/fantasy/league/1papyorqllbhqzl7/players;statusOrTeamFilter=ALL;pageNumber=1"
+SCRAPE_MANIFEST = Path(".scrape_manifest.json")
+# Both NST pages are scraped concurrently, so guard the manifest's read-modify-write
+SCRAPE_MANIFEST_LOCK = threading.Lock()
+FANTRAX_COOKIES = Path("fantrax_cookies.txt")
+# Fantrax login page locators
+EMAIL_LOCATOR = (By.CSS_SELECTOR, 'input[formcontrolname="email"]')
+PASSWORD_LOCATOR = (By.CSS_SELECTOR, 'input[formcontrolname="password"]')
+LOGIN_BUTTON_LOCATOR = (By.CSS_SELECTOR, 'button[type="submit"]')
+LOGGED_IN_LOCATOR = (By.CSS_SELECTOR, "h5.text--ellipsis")
 
 
 # Scrape data
 def scrape_data(file_path):
     # Set the URL based on the file path
-    if file_path == "all_strengths.csv":
+    if file_path == "all_strengths.parquet":
         url = URL_ALL_STRENGTHS
-    elif file_path == "even_strength.csv":
+    elif file_path == "even_strength.parquet":
         url = URL_EVEN_STRENGTH
-    # Scrape the data
-    dataframe = pd.read_html(url, index_col=0)[0]
-    # Save to csv
-    dataframe.to_csv(file_path)
+    # Load the validators (ETag / Last-Modified) saved from the last scrape of each URL
+    with SCRAPE_MANIFEST_LOCK:
+        manifest = json.loads(SCRAPE_MANIFEST.read_text()) if SCRAPE_MANIFEST.exists() else {}
+    cached = manifest.get(url, {})
+    # Only ask for a conditional response if we still have the file to fall back on
+    headers = {}
+    if Path(file_path).exists():
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    response = requests.get(url, headers=headers, timeout=60)
+    response.raise_for_status()
+    # 304 Not Modified: the saved file is still current, touch it so it counts as fresh for another hour
+    if response.status_code == requests.codes.not_modified:
+        Path(file_path).touch()
+        return pd.read_parquet(file_path)
+
+    # Scrape the data, keeping only the columns we use with their dtypes
+    # Hand over the raw bytes so the parser picks up the page's own charset, like pd.read_html(url) did
+    dataframe = pd.read_html(io.BytesIO(response.content), index_col=0)[0]
+    # Coerce the stat columns first so a non-numeric cell (e.g. "-") becomes NaN instead of failing the cast
+    numeric = [column for column, dtype in NST_DTYPES.items() if dtype is not str]
+    dataframe[numeric] = dataframe[numeric].apply(pd.to_numeric, errors="coerce")
+    dataframe = dataframe.loc[:, NST_COLUMNS].astype(NST_DTYPES)
+    # Save to parquet, which keeps the dtypes so cached loads come back ready to use
+    dataframe.to_parquet(file_path)
+    # Remember the validators for the next conditional request
+    with SCRAPE_MANIFEST_LOCK:
+        # Re-read so an entry saved by the other scrape in the meantime isn't lost
+        manifest = json.loads(SCRAPE_MANIFEST.read_text()) if SCRAPE_MANIFEST.exists() else {}
+        manifest[url] = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+        SCRAPE_MANIFEST.write_text(json.dumps(manifest, indent=2))
 
     return dataframe
 
@@ -78,12 +138,12 @@ def load_data(file_path):
     hour = 3600
     # Check if the file exists
     if file.exists():
-        # Get the modification time of the CSV
+        # Get the modification time of the file
         modtime = file.stat().st_mtime
         # Get the current time
         current_time = time.time()
         # If the file is less than an hour old, load it else scrape the data
-        dataframe = pd.read_csv(file_path, index_col=0) if current_time - modtime < hour else scrape_data(file_path)
+        dataframe = pd.read_parquet(file_path) if current_time - modtime < hour else scrape_data(file_path)
     # If the file doesn't exist, scrape the data
     else:
         dataframe = scrape_data(file_path)
@@ -92,35 +152,70 @@ def load_data(file_path):
 
 
 def setup_driver():
-    options = Options()
-    options.set_preference("browser.download.folderList", 2)  # custom location
-    options.set_preference("browser.download.manager.showWhenStarting", False)  # noqa: FBT003
-    options.set_preference("browser.download.dir", str(Path.cwd()))
-    options.set_preference("browser.helperApps.neverAsk.saveToDisk", "text/csv")
-    return webdriver.Firefox(options=options)
+    driver = webdriver.Firefox(options=Options())
+    # Rely only on the explicit waits below so each lookup isn't padded by an implicit wait
+    driver.implicitly_wait(0)
+    return driver
 
 
 def login(driver, wait):
     driver.get("https://www.fantrax.com/login")
-    email = wait.until(ec.presence_of_element_located((By.CSS_SELECTOR, 'input[formcontrolname="email"]')))
-    password = wait.until(ec.presence_of_element_located((By.CSS_SELECTOR, 'input[formcontrolname="password"]')))
+    email = wait.until(ec.presence_of_element_located(EMAIL_LOCATOR))
+    password = wait.until(ec.presence_of_element_located(PASSWORD_LOCATOR))
     with Path("credentials.json").open() as f:
         credentials = json.load(f)
     email.send_keys(credentials["username"])
     password.send_keys(credentials["password"])
-    login_button = wait.until(ec.element_to_be_clickable((By.CSS_SELECTOR, 'button[type="submit"]')))
+    login_button = wait.until(ec.element_to_be_clickable(LOGIN_BUTTON_LOCATOR))
     login_button.click()
+    # Wait for the element with the class "text--ellipsis" to be present, i.e. we're logged in
+    wait.until(ec.presence_of_element_located(LOGGED_IN_LOCATOR))
 
 
-def download_data(driver, wait, file_path):
+# Log in through the browser and hand the session cookies over to requests
+def refresh_cookies(cookie_jar):
+    # Set up the driver and set the wait time
+    driver = setup_driver()
+    wait = WebDriverWait(driver, 10, poll_frequency=0.2)
+    try:
+        # Login to Fantrax
+        login(driver, wait)
+        # Copy the browser's cookies into the jar and save them for the next run
+        for cookie in driver.get_cookies():
+            cookie_jar.set_cookie(
+                requests.cookies.create_cookie(
+                    name=cookie["name"],
+                    value=cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/"),
+                    secure=cookie.get("secure", False),
+                    expires=cookie.get("expiry"),
+                ),
+            )
+        cookie_jar.save(ignore_discard=True)
+    finally:
+        driver.quit()
+
+
+# requests session that reuses the Fantrax cookies saved by a previous login
+def fantrax_session():
+    session = requests.Session()
+    session.cookies = http.cookiejar.LWPCookieJar(FANTRAX_COOKIES)
+    if FANTRAX_COOKIES.exists():
+        # A corrupt cookie file just means we log in again
+        try:
+            session.cookies.load(ignore_discard=True)
+        except http.cookiejar.LoadError:
+            session.cookies.clear()
+    return session
+
+
+def download_data(session):
     today = datetime.datetime.now(tz=datetime.UTC).strftime("%Y-%m-%d")
 
     url = f"https://www.fantrax.com/fxpa/downloadPlayerStats?leagueId=1papyorqllbhqzl7&pageNumber=1&view=STATS&positionOrGroup=HOCKEY_SKATING&seasonOrProjection=SEASON_31h_YEAR_TO_DATE&timeframeTypeCode=YEAR_TO_DATE&transactionPeriod=15&miscDisplayType=1&sortType=SCORE&maxResultsPerPage=20&statusOrTeamFilter=ALL&scoringCategoryType=5&timeStartType=PERIOD_ONLY&schedulePageAdj=0&searchName=&datePlaying=ALL&startDate=2023-10-10&endDate={today}&teamId=0ph241vmllbhqzlf&"
-    # Wait for the element with the class "text--ellipsis" to be present
-    wait.until(ec.presence_of_element_located((By.CSS_SELECTOR, "h5.text--ellipsis")))
-    driver.get(url)
-    default_filename = "Fantrax-Players-Fantasy Beard League.csv"
-    shutil.move(default_filename, file_path)
+    # Errors aren't raised here, a 401/403 without valid cookies just means we need to log in
+    return session.get(url, timeout=60)
 
 
 # This will be used to scrape data from Fantrax
@@ -132,21 +227,60 @@ def scrape_fantrax(file_path):
         modtime = datetime.datetime.fromtimestamp(file.stat().st_mtime, tz=datetime.UTC)
         # Check if it was modified today
         if modtime.date() == datetime.datetime.now(tz=datetime.UTC).date():
-            return pd.read_csv(file_path, index_col=0, nrows=1000)
-
-    # Set up the driver and set the wait time
-    driver = setup_driver()
-    wait = WebDriverWait(driver, 10)
-    # Login to Fantrax
-    login(driver, wait)
-    # Download the data
-    download_data(driver, wait, file_path)
-    # Read the CSV into a dataframe
-    data = pd.read_csv(file_path, nrows=1000)
+            return pd.read_csv(file_path, index_col=0, nrows=1000, dtype=FANTRAX_DTYPES)
+
+    # Try the download with the saved cookies first, no browser needed
+    session = fantrax_session()
+    response = download_data(session)
+    data = parse_fantrax_csv(response.content) if response.ok else None
+    # Without a valid login Fantrax doesn't send the CSV, so log in through the browser and retry
+    if data is None:
+        refresh_cookies(session.cookies)
+        response = download_data(session)
+        response.raise_for_status()
+        data = parse_fantrax_csv(response.content)
+    # Fail loudly rather than caching a login page as today's data
+    if data is None:
+        msg = "Fantrax did not return the player stats CSV, even after logging in again"
+        raise RuntimeError(msg)
+    # Only a valid export is saved for the rest of today
+    file.write_bytes(response.content)
+    return data
 
-    driver.quit()
 
-    return data
+# Parse a Fantrax player stats export straight from the response, None if it isn't one (e.g. the login page)
+def parse_fantrax_csv(content):
+    try:
+        data = pd.read_csv(io.BytesIO(content), nrows=1000, dtype=FANTRAX_DTYPES)
+    except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError):
+        return None
+    # A real export always has the player identity columns
+    return data if set(FANTRAX_DTYPES).issubset(data.columns) else None
+
+
+# Sum z-scores across categories
+# Compiled with numba: the column stats and the per player sums each run in parallel
+# cache=True saves the compiled kernel to __pycache__, so only the first run pays the compile cost
+# fastmath is limited to reassociation/contraction so NaN checks still work
+@njit(parallel=True, fastmath={"reassoc", "contract"}, cache=True)
+def sum_zscores(values):
+    num_players, num_categories = values.shape
+    # Mean and standard deviation of each category (ddof=0, matching scipy.stats.zscore)
+    means = np.empty(num_categories)
+    stds = np.empty(num_categories)
+    for j in prange(num_categories):
+        means[j] = values[:, j].mean()
+        stds[j] = values[:, j].std()
+    # Each player's value is the sum of their z-scores across all categories (NaNs skipped, as DataFrame.sum did)
+    totals = np.zeros(num_players)
+    for i in prange(num_players):
+        total = 0.0
+        for j in range(num_categories):
+            zscore = (values[i, j] - means[j]) / stds[j]
+            if not np.isnan(zscore):
+                total += zscore
+        totals[i] = total
+    return totals
 
 
 # Add D and STP column
@@ -161,15 +295,26 @@ def add_d_and_stp(df_all, df_even):
 # Add things for cleaning data if needed
 def clean_data(dataframe):
     # Create a unique ID for each player to avoid issues with same name players
-    dataframe["UID"] = dataframe.groupby("Player").cumcount()
+    # The UID is the running count of each name (0 for the first, 1 for the second, ...), like groupby().cumcount()
+    # Done with factorize + bincount so no GroupBy object has to be built
+    codes, _ = pd.factorize(dataframe["Player"], use_na_sentinel=False)
+    # Stable sort keeps same name players in their original order
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes)
+    # Position in the sorted order minus where that name's run starts gives the running count
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    uid = np.empty_like(codes)
+    uid[order] = np.arange(len(codes)) - starts
+    dataframe["UID"] = uid
 
     return dataframe
 
 
 # Analyze data
 def analyze_data(dataframe):
-    # Make a copy of the dataframe to avoid modifying the original data
-    dataframe = dataframe.copy()
+    # Work on just the columns we output, this copies those instead of the whole dataframe
+    # and still avoids modifying the original data
+    dataframe = dataframe.loc[:, [*COLUMN_ORDER, "UID"]]
 
     # Start index at 1 for better readability (Python usually starts indexing at 0)
     dataframe.index = dataframe.index + 1
@@ -190,20 +335,24 @@ def analyze_data(dataframe):
 
     # Calculate z-scores for overall season statistics
     # Z-scores standardize data to have mean of 0 and standard deviation of 1
-    for category in categories:
-        dataframe[category] = pd.to_numeric(dataframe[category], errors="coerce")
-    filtered_data = dataframe[categories].apply(zscore)
-    dataframe["Season Value"] = filtered_data.sum(axis=1)
-    season_rankings = dataframe.sort_values("Season Value", ascending=False)
+    # Coerce every category in one block assignment; anything non-numeric becomes NaN
+    dataframe[categories] = dataframe[categories].apply(pd.to_numeric, errors="coerce")
+    # Pull the categories out once, both the season and per game values are computed from this array
+    season_stats = dataframe[categories].to_numpy(dtype=np.float64)
+    dataframe["Season Value"] = sum_zscores(season_stats)
 
     # Normalize stats by games played
     # This gives per game statistics instead of total season statistics
-    for category in categories:
-        dataframe[category] = dataframe[category] / dataframe["GP"]
+    per_game_stats = season_stats / dataframe["GP"].to_numpy(dtype=np.float64)[:, None]
 
     # Calculate z-scores for per game statistics
-    filtered_data = dataframe[categories].apply(zscore)
-    dataframe["Per Game Value"] = filtered_data.sum(axis=1)
+    dataframe["Per Game Value"] = sum_zscores(per_game_stats)
+    # Both values side by side, one row per player, for finding discrepancies
+    values_df = dataframe.loc[:, ["Player", "UID", "GP", "Season Value", "Per Game Value"]]
+    season_rankings = dataframe.sort_values("Season Value", ascending=False)
+
+    # Per game rankings show the per game statistics
+    dataframe[categories] = per_game_stats
     per_game_rankings = dataframe.sort_values("Per Game Value", ascending=False)
 
     # Select and order columns
@@ -216,52 +365,54 @@ def analyze_data(dataframe):
     season_rankings.insert(0, "Rank", range(1, len(season_rankings) + 1))
     per_game_rankings.insert(0, "Rank", range(1, len(season_rankings) + 1))
 
-    # Return the rankings for both season and per game statistics
-    return season_rankings, per_game_rankings
+    # Return the rankings for both season and per game statistics, plus both values per player
+    return season_rankings, per_game_rankings, values_df
 
 
 # Find discrepancy between season value and per game value
-def find_value(season_rankings, per_game_rankings):
+def find_value(values_df):
     gp_min = 5
-    # Ensure Player and UID is set as index for both dataframes
-    season_rankings = season_rankings.set_index("Player")
-    per_game_rankings = per_game_rankings.set_index("Player")
     # Filter out players who have played 5 games or less
-    season_rankings = season_rankings[season_rankings["GP"] > gp_min]
-    per_game_rankings = per_game_rankings[per_game_rankings["GP"] > gp_min]
-    # Calculate discrepancy in value
-    discrepancy = per_game_rankings["Per Game Value"] - season_rankings["Season Value"]
-    # Create a new DataFrame for discrepancy
-    discrepancy_df = discrepancy.to_frame(name="Discrepancy")
+    values_df = values_df[values_df["GP"] > gp_min]
+    # Calculate discrepancy in value, both values are already on the same row
+    discrepancy = values_df["Per Game Value"] - values_df["Season Value"]
     # Filter players where Per Game Value is higher than Season Value
-    filtered_discrepancy = discrepancy_df[discrepancy_df["Discrepancy"] > 0]
-    # sort player by discrepancy
-    sorted_discrepancy = filtered_discrepancy.sort_values("Discrepancy", ascending=False)
-    # Select and return the top 50 players
-    return sorted_discrepancy.head(50)
+    filtered_discrepancy = values_df.assign(Discrepancy=discrepancy)[discrepancy > 0]
+    # Select and return the top 50 players, nlargest only keeps the 50 best instead of sorting everyone
+    return filtered_discrepancy.nlargest(50, "Discrepancy").set_index("Player")
 
 
 # Format and print dataframe
 def format_and_print(dataframe):
     # Nested function to color rows
-    # This function is used to apply a style to the DataFrame
-    def color_rows(s):
-        # Use a list comprehension to create a list of styles
+    # This function is used to style the whole DataFrame at once
+    def color_rows(df):
+        # Build one style per row with a single vectorized op
         # If the row index is even, the background color will be #44475a
         # If the row index is odd, the background color will be #282a36
-        return ["background-color: #44475a" if i % 2 else "background-color: #282a36" for i in range(len(s))]
+        row_styles = np.where(np.arange(len(df)) % 2, "background-color: #44475a", "background-color: #282a36")
+        # Repeat each row's style across every column
+        styles = np.broadcast_to(row_styles[:, None], df.shape)
+        return pd.DataFrame(styles, index=df.index, columns=df.columns)
 
     # Apply the color_rows function to the DataFrame
-    # This will color the rows according to the rules defined in color_rows
+    # axis=None hands color_rows the whole DataFrame instead of calling it once per column
     # The hide method is used to hide the index of the DataFrame
-    return dataframe.style.apply(color_rows).hide_index()
+    return dataframe.style.apply(color_rows, axis=None).hide_index()
 
 
 # Visualize rankings
-def visualize_top_50_discrepancy(season_rankings, per_game_rankings):
+def visualize_top_50_discrepancy(values_df, file_path="discrepancy.png"):
+    # Imported here so daily runs without --plot never load matplotlib
+    # Agg renders straight to a file, no GUI window to block on
+    import matplotlib as mpl  # noqa: PLC0415
+
+    mpl.use("Agg")
+    from matplotlib import pyplot as plt  # noqa: PLC0415
+
     # Get top 50 players by discrepancy
     # The find_value function is expected to return a DataFrame of the top 50 players by discrepancy
-    top_50_players = find_value(season_rankings, per_game_rankings)
+    top_50_players = find_value(values_df)
 
     # Sort players by discrepancy in ascending order
     # This makes it easier to see which players have the largest discrepancy
@@ -276,33 +427,21 @@ def visualize_top_50_discrepancy(season_rankings, per_game_rankings):
 
     # Add discrepancy values at the end of each bar
     # This makes it easier to see the exact discrepancy value for each player
-    for bar in bars:
-        xval = bar.get_width()
-        # The text is positioned at the end of the bar, in the middle vertically
-        plt.text(xval, bar.get_y() + bar.get_height() / 2, round(xval, 2), va="center")
+    # bar_label labels every bar in one call, positioned at the end of the bar and centered vertically
+    plt.gca().bar_label(bars, fmt="%.2f", padding=2)
 
     # Set the title of the plot and the labels of the x and y axes
     plt.title("Top 50 Players by Discrepancy")
     plt.xlabel("Discrepancy")
     plt.ylabel("Player")
 
-    # Display the plot
-    plt.show()
+    # Save the plot
+    plt.savefig(file_path, dpi=80)
+    plt.close()
 
 
-# Output to Google Sheets
-def output_to_gsheets(dataframe, worksheet_name, column_order):
-    gc = gspread.oauth()
-    sh = gc.open("FantasyStats")
-
-    # Get the worksheet or create it if it doesn't exist
-    try:
-        worksheet = sh.worksheet(worksheet_name)
-    except gspread.exceptions.WorksheetNotFound:
-        worksheet = sh.add_worksheet(title=worksheet_name, rows="400", cols="25")
-
-    # Clear the worksheet
-    worksheet.clear()
+# Build the Google Sheets range and values for one worksheet
+def build_sheet_values(dataframe, worksheet_name, column_order):
     # Convert the index to a column
     dataframe = dataframe.reset_index(level=0)
 
@@ -314,25 +453,70 @@ def output_to_gsheets(dataframe, worksheet_name, column_order):
     num_cols = len(dataframe.columns)
     # Convert column number to letter
     col_letter = chr(64 + num_cols)
-    range_name = f"A1:{col_letter}{num_rows}"
+    range_name = f"'{worksheet_name}'!A1:{col_letter}{num_rows}"
+
+    # Convert to plain Python values once, missing values become None (empty cells) since NaN isn't valid JSON
+    values = dataframe.astype(object).where(dataframe.notna(), None).to_numpy().tolist()
+
+    return range_name, [dataframe.columns.tolist(), *values]
+
 
-    # Update the worksheet with the DataFrame data
-    worksheet.update(
-        values=[dataframe.columns.to_numpy().tolist(), *dataframe.to_numpy().tolist()],
-        range_name=range_name,
+# Output to Google Sheets
+# Writes every worksheet with one batch clear and one batch update
+# sheets maps each worksheet name to the (dataframe, column_order) to write there
+def write_to_gsheets(sh, sheets):
+    updates = [
+        build_sheet_values(dataframe, worksheet_name, column_order)
+        for worksheet_name, (dataframe, column_order) in sheets.items()
+    ]
+
+    # Create any worksheet that doesn't exist yet
+    existing = {worksheet.title for worksheet in sh.worksheets()}
+    for worksheet_name in sheets:
+        if worksheet_name not in existing:
+            sh.add_worksheet(title=worksheet_name, rows="400", cols="25")
+
+    # Clear the worksheets
+    sh.values_batch_clear(body={"ranges": [f"'{worksheet_name}'" for worksheet_name in sheets]})
+    # Update the worksheets with the DataFrame data
+    sh.values_batch_update(
+        body={
+            "valueInputOption": "RAW",
+            "data": [{"range": range_name, "values": values} for range_name, values in updates],
+        },
     )
 
 
 # Main function
 def main():
-    all_strengths = load_data("all_strengths.csv")
-    even_strength = load_data("even_strength.csv")
-    all_stats_df = add_d_and_stp(all_strengths, even_strength)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--plot",
+        action="store_true",
+        help="save a chart of the top 50 discrepancies to discrepancy.png",
+    )
+    args = parser.parse_args()
+
+    # Both loads are network bound on a cache miss, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        all_strengths_future = executor.submit(load_data, "all_strengths.parquet")
+        even_strength_future = executor.submit(load_data, "even_strength.parquet")
+        all_strengths, even_strength = all_strengths_future.result(), even_strength_future.result()
+    all_stats_df = clean_data(add_d_and_stp(all_strengths, even_strength))
     fantrax_data = scrape_fantrax("fantrax_data.csv")  # noqa: F841
-    season_rankings, per_game_rankings = analyze_data(all_stats_df)
-    visualize_top_50_discrepancy(season_rankings, per_game_rankings)
-    output_to_gsheets(season_rankings, "Season Rankings", ["Rank", "Season Value", *COLUMN_ORDER])
-    output_to_gsheets(per_game_rankings, "Per Game Rankings", ["Rank", "Per Game Value", *COLUMN_ORDER])
+    season_rankings, per_game_rankings, values_df = analyze_data(all_stats_df)
+    if args.plot:
+        visualize_top_50_discrepancy(values_df)
+    # Authenticate and look up the spreadsheet once, every worksheet write goes through this handle
+    gc = gspread.oauth()
+    sh = gc.open("FantasyStats")
+    write_to_gsheets(
+        sh,
+        {
+            "Season Rankings": (season_rankings, ["Rank", "Season Value", *COLUMN_ORDER]),
+            "Per Game Rankings": (per_game_rankings, ["Rank", "Per Game Value", *COLUMN_ORDER]),
+        },
+    )
 
 
 # Run the main function